@@ -30,6 +30,7 @@
 #   BLOCK 16 — Listing Helper: extract_page_content_from_detail_soup()
 #   BLOCK 17 — Listing Helper: extract_contact_and_email_from_detail()
 #   BLOCK 18 — Listing Helper: fetch_detail_page()
+#   BLOCK 18b — Listing Helper: build_listing_from_card()
 #   BLOCK 19 — API Endpoint: /api/listings
 #   BLOCK 20 — API Endpoint: /api/locations
 #   BLOCK 21 — API Endpoint: /api/office-images
@@ -44,14 +45,20 @@
 
 import os
 import re
-import html
 import time
 import json
 import uuid
 import logging
 import contextvars
+import hashlib
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
+from html import unescape
+from http.cookiejar import DefaultCookiePolicy
+from itertools import chain
 from typing import Any
 from urllib.parse import quote
 
@@ -59,8 +66,11 @@ from flask import Flask, jsonify, Response, request, g, has_request_context
 from flask_cors import CORS
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 
 # -----------------------------------------------------------------------------
 # IRRES logging (inlined; was logging_config.py). Env: LOG_LEVEL, LOG_JSON=1
@@ -161,7 +171,7 @@ def configure_logging(service: str = "irres", level: str | None = None) -> None:
 # Initialize Flask App
 app = Flask(__name__)
 CORS(app)
-app.config['JSON_AS_ASCII'] = False  # Ensure UTF-8 characters are preserved in JSON output
+app.json.ensure_ascii = False  # jsonify() endpoints: keep UTF-8 characters as-is (/api/listings uses orjson)
 
 configure_logging(service="api")
 logger = logging.getLogger("irres.api")
@@ -212,7 +222,7 @@ def _irres_request_log_done(response):
 #
 # Limits expensive scraping endpoints to prevent:
 #   - Server resource exhaustion (CPU, memory, bandwidth)
-#   - Worker process starvation (only 2 sync workers on Render.com)
+#   - Worker thread starvation (2 gthread workers x 4 threads on Render.com)
 #   - IRRES.be IP ban from hitting their server too frequently
 #   - Authenticated DoS attacks on expensive endpoints
 #
@@ -349,6 +359,70 @@ HEADERS = {
     )
 }
 
+# Upper bound on concurrent detail page requests to IRRES.be per scrape.
+# Kept modest on purpose (IRRES.be rate limits); override with the
+# DETAIL_FETCH_WORKERS environment variable. A malformed value falls back to
+# the default instead of failing the import.
+try:
+    DETAIL_FETCH_WORKERS = max(1, int(os.getenv("DETAIL_FETCH_WORKERS", "8")))
+except ValueError:
+    logger.warning(
+        "event=config_invalid name=DETAIL_FETCH_WORKERS value=%r fallback=8",
+        os.getenv("DETAIL_FETCH_WORKERS"),
+    )
+    DETAIL_FETCH_WORKERS = 8
+
+# Shared HTTP session for all IRRES.be fetches: keeps TCP/TLS connections
+# alive across the index page and every detail page instead of paying a new
+# handshake per request. pool_maxsize must cover DETAIL_FETCH_WORKERS.
+# Cookies are refused so each request stays stateless, as with requests.get().
+# Connection failures and 502/503/504 get two quick retries; read timeouts
+# are not retried and Retry-After is ignored (urllib3 would otherwise sleep
+# for whatever the server asks, up to hours), so only the short backoff
+# between attempts adds to the request time.
+HTTP_RETRY = Retry(
+    total=2,
+    read=False,
+    backoff_factor=0.2,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET"}),
+    respect_retry_after_header=False,
+    raise_on_status=False,   # secure_get() raise_for_status() reports the final status
+)
+HTTP_SESSION = requests.Session()
+HTTP_SESSION.headers.update(HEADERS)
+HTTP_SESSION.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+HTTP_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=max(16, DETAIL_FETCH_WORKERS),
+        max_retries=HTTP_RETRY,
+    ),
+)
+
+# Precompiled regular expressions for the per-listing / per-image hot paths.
+# URLs
+_RE_PAND_ID           = re.compile(r"/pand/(\d+)")
+_RE_PAND_HREF         = re.compile(r"/pand/\d+/", re.I)
+_RE_SRCSET_WIDTH      = re.compile(r"(\d+)w", re.I)
+_RE_STYLE_URL         = re.compile(r'url\(["\']?([^"\')]+)["\']?\)')
+# Photo ranking (listing card / detail page)
+_RE_PREFERRED_PHOTO   = re.compile(r"/uploads|uploads_c|/siteassets|/panden|\.(?:jpg|jpeg|png|webp|gif)(?:\?|$)", re.I)
+# Listing card classes / text
+_RE_ESTATE_CITY       = re.compile(r"estate-city")
+_RE_ESTATE_TYPE       = re.compile(r"estate-type")
+_RE_PRICE_DIV_CLASS   = re.compile(r"flex items-center text-lg")
+_RE_PRICE_STATUS      = re.compile(r"Prijs op aanvraag|Compromis", re.I)
+# Address / page content
+_RE_DIGIT             = re.compile(r"\d")
+_RE_POSTAL_CITY       = re.compile(r"^\d{4}\s+\S")
+_RE_BLANK_LINES       = re.compile(r"\n{3,}")
+# Contact
+_RE_MAILTO_ADDR       = re.compile(r"mailto:([^?]+)")
+_RE_EMAIL             = re.compile(r"([A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,})")
+_RE_EMAIL_LOCAL_SPLIT = re.compile(r"[._\-]")
+
 
 # =============================================================================
 # BLOCK 5 — UTILITY: secure_get() & TYPE_MAPPING
@@ -364,10 +438,15 @@ TYPE_MAPPING = {
     'land':     'Grond',
 }
 
+# Prebuilt lookups for the per-card type checks: raw names match
+# case-insensitively, Dutch display names only as-is.
+_TYPE_LOOKUP      = {k.lower(): v for k, v in TYPE_MAPPING.items()}
+_TYPE_DUTCH_NAMES = frozenset(TYPE_MAPPING.values())
+
 
 def secure_get(url, headers=None, timeout=15):
     """
-    Secure wrapper around requests.get() that enforces HTTPS and TLS validation.
+    Secure wrapper around HTTP_SESSION.get() that enforces HTTPS and TLS validation.
 
     Args:
         url     : Target URL. Will be upgraded to HTTPS automatically if needed.
@@ -396,7 +475,7 @@ def secure_get(url, headers=None, timeout=15):
                 url = f'https://irres.be/{url.lstrip("/")}'
 
     try:
-        response = requests.get(
+        response = HTTP_SESSION.get(
             url,
             headers=headers or HEADERS,
             timeout=timeout,
@@ -435,6 +514,18 @@ class IRRESLocationScraper:
 
     BASE_URL = "https://irres.be/te-koop"
 
+    # Labels that appear in the filter <li> elements but are property types,
+    # not location names (includes the Dutch names from TYPE_MAPPING).
+    NON_LOCATION_TYPES = frozenset({
+        'Huis', 'Appartement', 'Grond',
+        'Kantoor', 'Garage', 'Parking',
+        'Opbrengsteigendom', 'Handelspand',
+        'Industrieel', 'Commercieel', 'Project',
+    }) | _TYPE_DUTCH_NAMES
+
+    # parse_locations() only needs the city filter block of /te-koop.
+    CITY_FILTER_STRAINER = SoupStrainer('div', attrs={'data-category': 'city'})
+
     def __init__(self, timeout: int = 15):
         """
         Initialize the scraper.
@@ -450,12 +541,12 @@ class IRRESLocationScraper:
     # BLOCK 6a — IRRESLocationScraper.fetch_page()
     # -------------------------------------------------------------------------
 
-    def fetch_page(self) -> str:
+    def fetch_page(self) -> bytes:
         """
         Fetch the IRRES.be /te-koop page HTML via a secure HTTPS GET request.
 
         Returns:
-            Full HTML of the page as a string.
+            Raw HTML bytes of the page (left for lxml to decode).
 
         Raises:
             requests.RequestException: If the request fails for any reason.
@@ -466,9 +557,9 @@ class IRRESLocationScraper:
             logger.debug(
                 "event=http_get_ok url=%s bytes=%s",
                 self.BASE_URL,
-                len(response.text),
+                len(response.content),
             )
-            return response.text
+            return response.content
         except requests.RequestException as e:
             logger.debug("event=locations_fetch_failed url=%s error=%s", self.BASE_URL, e)
             raise
@@ -477,7 +568,7 @@ class IRRESLocationScraper:
     # BLOCK 6b — IRRESLocationScraper.parse_locations()   ← FIXED
     # -------------------------------------------------------------------------
 
-    def parse_locations(self, html_content: str):
+    def parse_locations(self, html_content: bytes):
         """
         Parse locations and location groups from the raw HTML of /te-koop.
 
@@ -518,7 +609,9 @@ class IRRESLocationScraper:
                                         "De Pinte", "Zevergem"],
             }
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # Only the city filter block is materialized; the full page is parsed
+        # as a fallback when that block is missing (see Step 1).
+        soup = BeautifulSoup(html_content, 'lxml', parse_only=self.CITY_FILTER_STRAINER)
 
         all_locations  = []
         location_groups = {}
@@ -540,7 +633,7 @@ class IRRESLocationScraper:
             logger.warning(
                 "event=locations_parse_fallback client=parser detail=city_filter_container_missing"
             )
-            filter_container = soup
+            filter_container = BeautifulSoup(html_content, 'lxml')
 
         # ------------------------------------------------------------------
         # Step 2: Find the .search-data <ul>.
@@ -555,30 +648,16 @@ class IRRESLocationScraper:
             )
             return all_locations, location_groups
 
-        li_elements = search_data_ul.find_all(
-            'li',
-            attrs={'data-label': True, 'data-value': True}
-        )
+        li_elements = search_data_ul.select('li[data-label][data-value]')
         logger.debug(
             "event=locations_raw_li_count count=%s phase=before_dedup",
             len(li_elements),
         )
 
         # ------------------------------------------------------------------
-        # Step 3: Define filter blocklists.
-        # These values appear in filter <li> elements on the page but are
-        # property types, not location names.
-        # ------------------------------------------------------------------
-        NON_LOCATION_TYPES = {
-            'Huis', 'Appartement', 'Grond',
-            'Kantoor', 'Garage', 'Parking',
-            'Opbrengsteigendom', 'Handelspand',
-            'Industrieel', 'Commercieel', 'Project',
-        }
-        MAPPED_TYPES = set(TYPE_MAPPING.values())   # Dutch names from TYPE_MAPPING
-
-        # ------------------------------------------------------------------
-        # Step 4: Iterate, filter, and deduplicate.
+        # Step 3: Iterate, filter, and deduplicate.
+        # Property type labels are rejected with one set lookup on the label
+        # (NON_LOCATION_TYPES) and one on its lowercase form (_TYPE_LOOKUP).
         # Using a plain dict (ordered in Python 3.7+) as a seen-set so the
         # first occurrence of each label is kept — matching JS dropdown order.
         # ------------------------------------------------------------------
@@ -596,12 +675,8 @@ class IRRESLocationScraper:
             if '€' in label:
                 continue
 
-            # Skip property type elements (Dutch names)
-            if label in NON_LOCATION_TYPES or label in MAPPED_TYPES:
-                continue
-
-            # Skip property type elements (English / raw names from TYPE_MAPPING)
-            if label in TYPE_MAPPING or label.lower() in TYPE_MAPPING:
+            # Skip property type elements (Dutch names, English / raw names)
+            if label in self.NON_LOCATION_TYPES or label.lower() in _TYPE_LOOKUP:
                 continue
 
             # Skip duplicates — first occurrence of each label wins
@@ -694,16 +769,16 @@ class IRRESOfficeImagesScraper:
     def __init__(self, timeout: int = 10):
         self.timeout = timeout
 
-    def fetch_page(self) -> str:
+    def fetch_page(self) -> bytes:
         try:
             logger.debug("event=http_get_start url=%s", self.BASE_URL)
             response = secure_get(self.BASE_URL, headers=HEADERS, timeout=self.timeout)
             logger.debug(
                 "event=http_get_ok url=%s bytes=%s",
                 self.BASE_URL,
-                len(response.text),
+                len(response.content),
             )
-            return response.text
+            return response.content
         except requests.RequestException as e:
             logger.debug("event=office_fetch_failed url=%s error=%s", self.BASE_URL, e)
             raise
@@ -774,8 +849,8 @@ class IRRESOfficeImagesScraper:
             el = el.parent
         return title_p.parent
 
-    def parse_office_images(self, html_content: str) -> list:
-        soup = BeautifulSoup(html_content, "html.parser")
+    def parse_office_images(self, html_content: bytes) -> list:
+        soup = BeautifulSoup(html_content, "lxml")
         out = []
         for title_p in soup.find_all("p"):
             if not self._p_is_office_title(title_p):
@@ -837,6 +912,19 @@ def normalize_text(s):
     Returns:
         Normalized string, or '' if input is None or coercion fails.
     """
+    # Plain, reasonably short strings go through the memoized path; anything
+    # else (None, numbers, huge text blobs) is normalized without caching.
+    if type(s) is str and len(s) <= _NORMALIZE_TEXT_CACHE_MAX_LEN:
+        return _normalize_text_cached(s)
+    return _normalize_text_impl(s)
+
+
+# Strings longer than this are not worth keeping in the cache.
+_NORMALIZE_TEXT_CACHE_MAX_LEN = 2048
+
+
+def _normalize_text_impl(s):
+    """Uncached implementation behind normalize_text()."""
     if s is None:
         return ""
 
@@ -846,24 +934,34 @@ def normalize_text(s):
         return ""
 
     # Decode HTML entities
-    s = html.unescape(s)
+    if "&" in s:
+        s = unescape(s)
 
     # Decode literal unicode escape sequences
-    if "\\u" in s or "\\x" in s:
+    if "\\" in s and ("\\u" in s or "\\x" in s):
         try:
             s = bytes(s, "utf-8").decode("unicode_escape")
         except Exception:
             pass
 
-    # Collapse whitespace
-    s = " ".join(s.split())
-    return s.strip()
+    # Collapse whitespace. Printable text (isprintable() is False for tabs,
+    # newlines and non-ASCII spaces) without double spaces only needs trimming.
+    if s.isprintable() and "  " not in s:
+        return s.strip()
+    return " ".join(s.split())
+
+
+# Card fragments, labels and addresses repeat across listings and helpers.
+_normalize_text_cached = lru_cache(maxsize=4096)(_normalize_text_impl)
 
 
 # =============================================================================
 # BLOCK 9 — LISTING HELPER: normalize_url()
 # =============================================================================
 
+# Memoized: the same image URL shows up many times per page (src, data-src and
+# every srcset variant), and the result depends only on the arguments.
+@lru_cache(maxsize=4096)
 def normalize_url(src, add_tracking=False):
     """
     Make a URL absolute for the IRRES.be domain.
@@ -888,15 +986,21 @@ def normalize_url(src, add_tracking=False):
 
     src = src.strip().strip('\"\'')
 
-    if src.startswith("//"):
-        url = "https:" + src
-    elif src.startswith("/"):
-        url = "https://irres.be" + src
-    elif re.match(r'https?://', src, re.I):
+    # Common case: already absolute (lowercase scheme), no tracking wanted.
+    if not add_tracking and src.startswith(("https://", "http://")):
+        return src
+
+    # Absolute URLs that reach this point either have a mixed/upper-case
+    # scheme or need tracking added; the scheme is compared
+    # case-insensitively on the first 8 characters.
+    if src[:8].lower().startswith(("https://", "http://")):
         url = src
+    elif src[:1] == "/":
+        # Protocol-relative (//host/...) or root-relative (/path)
+        url = ("https:" + src) if src[1:2] == "/" else ("https://irres.be" + src)
     elif src.startswith("www."):
         url = "https://" + src
-    elif not re.search(r':', src):
+    elif ":" not in src:
         # Bare relative path — no scheme or port
         url = "https://irres.be/" + src.lstrip('/')
     else:
@@ -910,6 +1014,9 @@ def normalize_url(src, add_tracking=False):
     return url
 
 
+# Memoized: each card href is canonicalized by both the index dedup loop and
+# parse_main_listing_card().
+@lru_cache(maxsize=2048)
 def canonical_listing_url(href):
     """
     Absolute listing URL without query string or fragment.
@@ -941,7 +1048,7 @@ def parse_srcset_entries(srcset_str):
         raw_u = bits[0].strip()
         w = 0
         if len(bits) >= 2:
-            m = re.search(r"(\d+)w", bits[1], re.I)
+            m = _RE_SRCSET_WIDTH.search(bits[1])
             if m:
                 w = int(m.group(1))
         out.append((raw_u, w))
@@ -953,20 +1060,16 @@ def best_url_from_srcset(srcset_str):
     Pick the image URL with the largest width descriptor from a srcset.
     If all widths are 0, return the last URL (common responsive-image ordering).
     """
-    entries = parse_srcset_entries(srcset_str)
-    if not entries:
-        return ""
-    abs_entries = []
-    for raw_u, w in entries:
+    # Single pass: track the first widest URL and the last usable URL instead
+    # of collecting every entry and scanning it again for the max width.
+    best_u, best_w, last_u = "", 0, ""
+    for raw_u, w in parse_srcset_entries(srcset_str):
         u = normalize_url(raw_u)
         if u and not u.startswith("data:") and "svg" not in u.lower():
-            abs_entries.append((u, w))
-    if not abs_entries:
-        return ""
-    max_w = max(e[1] for e in abs_entries)
-    if max_w > 0:
-        return max(abs_entries, key=lambda x: x[1])[0]
-    return abs_entries[-1][0]
+            last_u = u
+            if w > best_w:
+                best_u, best_w = u, w
+    return best_u if best_w > 0 else last_u
 
 
 def listing_button1_value(listing_url):
@@ -977,12 +1080,14 @@ def listing_button1_value(listing_url):
     return f"{listing_url}{sep}utm_source=habichat"
 
 
+# Memoized: a handful of agents cover every listing.
+@lru_cache(maxsize=256)
 def display_name_from_email(email):
     """Human label from contact email local-part (e.g. daphne@ → Daphne)."""
     if not email or "@" not in email:
         return ""
     local = email.split("@", 1)[0]
-    return " ".join(p.capitalize() for p in re.split(r"[._\-]", local) if p)
+    return " ".join(p.capitalize() for p in _RE_EMAIL_LOCAL_SPLIT.split(local) if p)
 
 
 def is_prijs_op_aanvraag_price(price_str):
@@ -1009,7 +1114,7 @@ def extract_listing_id_from_url(url):
     """
     if not url:
         return ""
-    m = re.search(r'/pand/(\d+)', url)
+    m = _RE_PAND_ID.search(url)
     return m.group(1) if m else ""
 
 
@@ -1017,6 +1122,25 @@ def extract_listing_id_from_url(url):
 # BLOCK 11 — LISTING HELPER: format_price_string()
 # =============================================================================
 
+# Every byte except ASCII 0-9, for bytes.translate(None, delete).
+_NON_DIGIT_BYTES = bytes(b for b in range(256) if not 0x30 <= b <= 0x39)
+
+
+def _dot_thousands(digits):
+    """
+    Group an ASCII digit string with dots as thousands separator.
+
+    '1085000' → '1.085.000'. Leading zeros are dropped, as int() would.
+    """
+    digits = digits.lstrip("0") or "0"
+    head   = len(digits) % 3 or 3
+    groups = [digits[:head]]
+    groups.extend(digits[i:i + 3] for i in range(head, len(digits), 3))
+    return ".".join(groups)
+
+
+# Memoized: many listings share the exact same raw price line.
+@lru_cache(maxsize=512)
 def format_price_string(raw):
     """
     Format a raw price string into a clean, consistent display value.
@@ -1039,34 +1163,63 @@ def format_price_string(raw):
 
     s = normalize_text(raw)
 
-    # Named status strings
-    if re.search(r'Prijs op aanvraag', s, re.I):
-        return "Prijs op aanvraag"
-    if re.search(r'Vraag\s+prijs\s+aan', s, re.I):
-        return "Vraag prijs aan"
-    if re.search(r'Compromis', s, re.I):
+    # Named status strings (normalize_text collapsed whitespace, so plain
+    # substring tests on the lowercased value are enough)
+    low = s.lower()
+    if "prijs" in low:
+        if "prijs op aanvraag" in low:
+            return "Prijs op aanvraag"
+        if "vraag prijs aan" in low:
+            return "Vraag prijs aan"
+    if "compromis" in low:
         return "Compromis in opmaak"
 
-    # Extract numeric part
-    cleaned = s.replace('€', '').replace('\u20ac', '')
-    cleaned = re.sub(r'(?i)prijs op aanvraag|compromis.*', '', cleaned).strip()
-    digits  = re.sub(r'[^0-9]', '', cleaned)
+    # Keep ASCII digits only (drops €, dots, spaces, letters, ...): encode()
+    # discards non-ASCII characters, translate() deletes the rest in C.
+    digits = s.encode("ascii", "ignore").translate(None, _NON_DIGIT_BYTES).decode("ascii")
 
     if not digits:
         return s   # Fallback: return normalized original
 
-    try:
-        num       = int(digits)
-        formatted = format(num, ',').replace(',', '.')   # Dot as thousands separator
-        return f"€ {formatted}"
-    except Exception:
-        return s
+    return f"€ {_dot_thousands(digits)}"
 
 
 # =============================================================================
 # BLOCK 12 — LISTING HELPER: parse_main_listing_card()
 # =============================================================================
 
+def _iter_card_text_parts(link):
+    """
+    Yield the normalized, non-empty text fragments of a listing card.
+
+    Same fragments as get_text(separator="|", strip=True).split("|"), without
+    building the joined string first.
+    """
+    for text in link.stripped_strings:
+        for x in text.split("|"):
+            x = normalize_text(x)
+            if x:
+                yield x
+
+
+def _is_card_price_part(p):
+    """True when a card text fragment holds the price (or a price status)."""
+    return "€" in p or _RE_PRICE_STATUS.search(p) is not None
+
+
+def _is_card_teaser_class(c):
+    """class_ matcher for the card teaser <p> (text-18 ... mb-10 ... leading-7)."""
+    if not c:
+        return False
+    s = " ".join(c) if isinstance(c, list) else str(c)
+    return "text-18" in s and "mb-10" in s and "leading-7" in s
+
+
+def listing_anchor_name(link):
+    """Site listing_id of a card: the <a> name / data-name attribute."""
+    return normalize_text(link.get("name") or link.get("data-name") or "")
+
+
 def parse_main_listing_card(link):
     """
     Parse a single listing card <a> element from the /te-koop overview page.
@@ -1081,15 +1234,15 @@ def parse_main_listing_card(link):
       - anchor_name   : name / data-name attribute (required listing_id on site).
     """
     # --- Listing URL (canonical, no query) ---
-    href = normalize_text(link.get("href") or "")
-    listing_url = canonical_listing_url(href)
+    # canonical_listing_url() normalizes the raw href itself.
+    listing_url = canonical_listing_url(link.get("href") or "")
 
     # --- Anchor name (site listing_id) ---
-    anchor_name = normalize_text(link.get("name") or link.get("data-name") or "")
+    anchor_name = listing_anchor_name(link)
 
     # --- Location from <h2 class="estate-city"> ---
     location = ""
-    city_h2 = link.find("h2", class_=re.compile(r"estate-city"))
+    city_h2 = link.find("h2", class_=_RE_ESTATE_CITY)
     if city_h2:
         location = city_h2.get("data-value", "").strip()
         if not location:
@@ -1097,51 +1250,49 @@ def parse_main_listing_card(link):
 
     # --- Property type: estate-type element (English) before mapping ---
     listing_type_raw = ""
-    et_el = link.find(class_=re.compile(r"estate-type"))
+    et_el = link.find(class_=_RE_ESTATE_TYPE)
     if et_el:
         listing_type_raw = normalize_text(et_el.get_text())
 
     # --- Description: dedicated teaser paragraph when present ---
     description = ""
 
-    def _classes_include(c, *needles):
-        if not c:
-            return False
-        s = " ".join(c) if isinstance(c, list) else str(c)
-        return all(n in s for n in needles)
-
-    desc_p = link.find(
-        "p",
-        class_=lambda c: _classes_include(c, "text-18", "mb-10", "leading-7"),
-    )
+    desc_p = link.find("p", class_=_is_card_teaser_class)
     if desc_p:
         description = normalize_text(desc_p.get_text())
 
     # --- Parse text content into parts (price + fallback description / type) ---
-    text = link.get_text(separator="|", strip=True)
-    text = normalize_text(text)
-    parts = [normalize_text(x) for x in text.split("|") if normalize_text(x)]
+    parts = list(_iter_card_text_parts(link))
 
     price = ""
     listing_type = ""
 
-    for p in parts:
-        if "€" in p or re.search(r"Prijs op aanvraag", p, re.I) or re.search(r"Compromis", p, re.I):
+    if description and listing_type_raw:
+        # Type and description already came from their dedicated elements;
+        # only the price still has to be picked out of the text fragments.
+        # The last price-like fragment wins, so scan from the end and stop.
+        price = next((p for p in reversed(parts) if _is_card_price_part(p)), "")
+        parts_to_classify = ()
+    else:
+        parts_to_classify = parts
+
+    for p in parts_to_classify:
+        if _is_card_price_part(p):
             price = p
             continue
-        if p in TYPE_MAPPING or p in TYPE_MAPPING.values() or p.lower() in TYPE_MAPPING:
+        tm = _TYPE_LOOKUP.get(p.lower())
+        if tm is None and p in _TYPE_DUTCH_NAMES:
+            tm = p
+        if tm:
             if not listing_type_raw:
                 listing_type_raw = p
-            listing_type = TYPE_MAPPING.get(p, TYPE_MAPPING.get(p.lower(), p))
+            listing_type = tm
             continue
         if not description and p != location and p != listing_type:
             description = p
 
     if listing_type_raw:
-        listing_type = TYPE_MAPPING.get(
-            listing_type_raw,
-            TYPE_MAPPING.get(listing_type_raw.lower(), listing_type_raw),
-        )
+        listing_type = _TYPE_LOOKUP.get(listing_type_raw.lower(), listing_type_raw)
 
     if not description and len(parts) >= 2:
         possible = parts[-1]
@@ -1165,115 +1316,149 @@ def parse_main_listing_card(link):
 # BLOCK 13 — LISTING HELPER: find_photo_on_element()
 # =============================================================================
 
-def find_photo_on_element(el):
-    """
-    Find the best image URL within a BeautifulSoup element.
+def _iter_descendant_tags(el, name):
+    """Lazily yield descendant tags of el called name (find_all builds a list)."""
+    for node in el.descendants:
+        if node.name == name:
+            yield node
 
-    Prefers widest srcset candidate, then upload paths / image extensions.
+
+def _iter_raw_photo_candidates(el):
     """
-    candidates = []
+    Yield raw image URL candidates on el, in ranking order.
 
-    for img in el.find_all("img"):
+    Tags are found lazily, so when an early <img> yields a preferred URL
+    the rest of the subtree is never walked.
+    """
+    for img in _iter_descendant_tags(el, "img"):
+        attrs = img.attrs
         for attr in ("srcset", "data-srcset"):
-            u = best_url_from_srcset(img.get(attr) or "")
-            if u:
-                candidates.append(u)
+            yield best_url_from_srcset(attrs.get(attr) or "")
         for attr in ("src", "data-src", "data-lazy-src", "data-original"):
-            v = img.get(attr)
-            if v:
-                candidates.append(v)
+            yield attrs.get(attr)
 
-    for source in el.find_all("source"):
-        u = best_url_from_srcset(source.get("srcset") or source.get("data-srcset") or "")
-        if u:
-            candidates.append(u)
+    for source in _iter_descendant_tags(el, "source"):
+        attrs = source.attrs
+        yield best_url_from_srcset(attrs.get("srcset") or attrs.get("data-srcset") or "")
 
-    for node in [el] + el.find_all(True):
+    # Only elements whose style attribute mentions url() can hold a photo.
+    for node in chain((el,), el.select('[style*="url("]')):
         style = node.get("style") or ""
         if "url(" in style:
-            m = re.search(r'url\(["\']?([^"\')]+)["\']?\)', style)
+            m = _RE_STYLE_URL.search(style)
             if m:
-                candidates.append(m.group(1))
+                yield m.group(1)
 
     for attr in ("data-src", "data-image", "data-bg", "data-photo", "data-thumb", "data-original"):
-        v = el.get(attr)
-        if v:
-            candidates.append(v)
+        yield el.get(attr)
+
 
-    normed = []
-    for c in candidates:
+def _iter_photo_candidates(el):
+    """Lazily yield absolute, non-SVG image URLs found on el."""
+    for c in _iter_raw_photo_candidates(el):
         if not c:
             continue
         c = normalize_url(c)
         if c and not c.startswith("data:") and "svg" not in c.lower():
-            normed.append(c)
+            yield c
+
 
-    for n in normed:
-        if re.search(r"/uploads|uploads_c|/siteassets|/panden", n, re.I) or re.search(
-            r"\.(jpg|jpeg|png|webp|gif)(?:\?|$)", n, re.I
-        ):
+def find_photo_on_element(el):
+    """
+    Find the best image URL within a BeautifulSoup element.
+
+    Prefers widest srcset candidate, then upload paths / image extensions.
+    Candidates are evaluated lazily: the scan stops at the first preferred
+    URL, so style / data-* attributes are only inspected when needed.
+    """
+    first = ""
+    for n in _iter_photo_candidates(el):
+        if _RE_PREFERRED_PHOTO.search(n):
             return n
+        if not first:
+            first = n
 
-    return normed[0] if normed else ""
+    return first
 
 
 # =============================================================================
 # BLOCK 14 — LISTING HELPER: find_landscape_image_from_detail()
 # =============================================================================
 
+_DETAIL_PHOTO_PATHS = ("/uploads", "uploads_c", "siteassets", "/panden")
+_DETAIL_PHOTO_EXTS  = (".jpg", ".jpeg", ".png", ".webp")
+
+
+def _is_detail_property_photo(url):
+    """True for an uploaded property photo (path marker and image extension)."""
+    low = url.lower()
+    return (
+        any(p in low for p in _DETAIL_PHOTO_PATHS)
+        and any(e in low for e in _DETAIL_PHOTO_EXTS)
+    )
+
+
 def find_landscape_image_from_detail(soup):
     """
     Search for the best property photo on a detail page (widest srcset wins).
     """
     main = (
-        soup.find("main", attrs={"data-barba": True, "data-barba-namespace": True})
-        or soup.find("main", attrs={"data-barba": True})
+        soup.select_one("main[data-barba][data-barba-namespace]")
+        or soup.select_one("main[data-barba]")
         or soup.find("main")
     )
     search_scope = main if main else soup
-    scored = []
 
-    for img in search_scope.find_all("img"):
-        for attr in ("srcset", "data-srcset"):
-            entries = parse_srcset_entries(img.get(attr) or "")
+    # One walk over the tree; candidates are bucketed by kind so the final
+    # ranking order (img, then source, then inline styles) is preserved.
+    img_scored    = []
+    source_scored = []
+    style_scored  = []
+
+    # Plain descendants walk: skips find_all()'s per-node matcher and list.
+    for node in search_scope.descendants:
+        name = node.name
+        if name is None:
+            continue   # text / comment node
+        # Read the attribute dict once; Tag.get() is a method call per lookup.
+        attrs = node.attrs
+        if name == "img":
+            for attr in ("srcset", "data-srcset"):
+                entries = parse_srcset_entries(attrs.get(attr) or "")
+                for raw_u, w in entries:
+                    u = normalize_url(raw_u)
+                    if u and not u.startswith("data:") and "svg" not in u.lower():
+                        img_scored.append((w, u))
+            for attr in ("src", "data-src", "data-original", "data-lazy-src"):
+                v = attrs.get(attr)
+                if v and not v.startswith("data:"):
+                    u = normalize_url(v)
+                    if u:
+                        img_scored.append((0, u))
+        elif name == "source":
+            entries = parse_srcset_entries(attrs.get("srcset") or attrs.get("data-srcset") or "")
             for raw_u, w in entries:
                 u = normalize_url(raw_u)
-                if u and not u.startswith("data:") and "svg" not in u.lower():
-                    scored.append((w, u))
-        for attr in ("src", "data-src", "data-original", "data-lazy-src"):
-            v = img.get(attr)
-            if v and not v.startswith("data:"):
-                u = normalize_url(v)
-                if u:
-                    scored.append((0, u))
+                if u and not u.startswith("data:"):
+                    source_scored.append((w, u))
 
-    for source in search_scope.find_all("source"):
-        entries = parse_srcset_entries(source.get("srcset") or source.get("data-srcset") or "")
-        for raw_u, w in entries:
-            u = normalize_url(raw_u)
-            if u and not u.startswith("data:"):
-                scored.append((w, u))
-
-    for el in search_scope.find_all(style=True):
-        style = el.get("style") or ""
-        if "url(" in style:
-            m = re.search(r'url\(["\']?([^"\')]+)["\']?\)', style)
+        style = attrs.get("style")
+        if style and "url(" in style:
+            m = _RE_STYLE_URL.search(style)
             if m:
                 u = normalize_url(m.group(1))
                 if u:
-                    scored.append((0, u))
-
-    prop = [
-        (w, u)
-        for w, u in scored
-        if re.search(r"/uploads|uploads_c|siteassets|/panden", u, re.I)
-        and re.search(r"\.(jpg|jpeg|png|webp)", u, re.I)
-    ]
+                    style_scored.append((0, u))
+
+    scored = img_scored + source_scored + style_scored
+
+    prop = [(w, u) for w, u in scored if _is_detail_property_photo(u)]
     pool = prop if prop else [(w, u) for w, u in scored if u]
     if not pool:
         return ""
-    pool.sort(key=lambda x: x[0], reverse=True)
-    return pool[0][1]
+    # Only the widest candidate is used: max() keeps the first of equal widths,
+    # exactly like the stable reverse sort it replaces, without sorting.
+    return max(pool, key=lambda x: x[0])[1]
 
 
 # =============================================================================
@@ -1300,7 +1485,7 @@ def _looks_like_street_line(s):
     """Heuristic: Belgian street lines usually contain a house number or a street keyword."""
     if not s or len(s) < 3:
         return False
-    if re.search(r"\d", s):
+    if _RE_DIGIT.search(s):
         return True
     low = s.lower()
     keywords = (
@@ -1313,7 +1498,7 @@ def _looks_like_street_line(s):
 
 def _belgian_postal_city_line(s):
     """Second line of a typical IRRES address: 4-digit postcode + locality."""
-    return bool(s and re.match(r"^\d{4}\s+\S", s))
+    return bool(s and _RE_POSTAL_CITY.match(s))
 
 
 def _format_address_pair(line1, line2):
@@ -1395,7 +1580,7 @@ def extract_page_content_from_detail_soup(soup):
     from bs4 import NavigableString, Comment, Tag
 
     try:
-        main = soup.find("main", attrs={"data-barba": True}) or soup.find("main")
+        main = soup.select_one("main[data-barba]") or soup.find("main")
         if not main:
             return ""
 
@@ -1484,7 +1669,7 @@ def extract_page_content_from_detail_soup(soup):
             return "".join(out)
 
         result = render_block(main)
-        result = re.sub(r"\n{3,}", "\n\n", result)
+        result = _RE_BLANK_LINES.sub("\n\n", result)
         return result.strip()
 
     except Exception as e:
@@ -1502,7 +1687,7 @@ def extract_contact_and_email_from_detail(soup):
 
     Strategy:
       1. Search for <a href="mailto:..."> links — most reliable source.
-      2. Fallback: scan full page text for an email pattern (regex).
+      2. Fallback: scan the page's body text for an email pattern (regex).
 
     First-name extraction:
       The local part of the email address (before @) is split on dot/underscore/
@@ -1519,18 +1704,19 @@ def extract_contact_and_email_from_detail(soup):
     first_name = ""
 
     search_roots = []
-    main = soup.find("main", attrs={"data-barba": True}) or soup.find("main")
+    main = soup.select_one("main[data-barba]") or soup.find("main")
     if main:
         search_roots.append(main)
     search_roots.append(soup)
 
+    # iselect() yields matches lazily, so the walk stops at the first usable
+    # mailto link instead of collecting every match in the root up front.
     for root in search_roots:
-        all_mailto = root.find_all("a", href=re.compile(r"^mailto:", re.I))
-        for a in all_mailto:
+        for a in root.css.iselect('a[href^="mailto:" i]'):
             href = a.get("href", "")
             if not href:
                 continue
-            m = re.search(r"mailto:([^?]+)", href)
+            m = _RE_MAILTO_ADDR.search(href)
             if m:
                 candidate = normalize_text(m.group(1))
                 if candidate:
@@ -1539,17 +1725,20 @@ def extract_contact_and_email_from_detail(soup):
         if email:
             break
 
-    # 2 — Regex fallback on page text
+    # 2 — Regex fallback on page text. Scan the <body> strings one by one and
+    # stop at the first hit instead of joining the whole page into one string
+    # (an address never spans two text nodes once they are space-joined).
     if not email:
-        text = soup.get_text(" ", strip=True)
-        m2   = re.search(r'([A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,})', text)
-        if m2:
-            email = normalize_text(m2.group(1))
+        for text in (soup.body or soup).stripped_strings:
+            m2 = _RE_EMAIL.search(text)
+            if m2:
+                email = normalize_text(m2.group(1))
+                break
 
     # Derive first name from email local part
     if email:
         local       = email.split('@')[0]
-        local_token = re.split(r'[._\-]', local)[0]
+        local_token = _RE_EMAIL_LOCAL_SPLIT.split(local)[0]
         if local_token:
             first_name = local_token.capitalize()
 
@@ -1562,8 +1751,8 @@ def extract_contact_and_email_from_detail(soup):
 
 def extract_price_from_detail_soup(soup):
     """Raw price line from the listing detail header."""
-    main = soup.find("main", attrs={"data-barba": True}) or soup.find("main") or soup
-    price_div = main.find("div", class_=re.compile(r"flex items-center text-lg"))
+    main = soup.select_one("main[data-barba]") or soup.find("main") or soup
+    price_div = main.find("div", class_=_RE_PRICE_DIV_CLASS)
     if price_div:
         price_p = price_div.find("p")
         if price_p:
@@ -1575,11 +1764,67 @@ def extract_price_from_detail_soup(soup):
 # BLOCK 18 — LISTING HELPER: fetch_detail_page()
 # =============================================================================
 
+# Raw detail page bodies are kept for a while so back-to-back scrapes only
+# download listings that are new (or whose entry expired).
+DETAIL_PAGE_CACHE_TTL     = 600   # seconds
+DETAIL_PAGE_CACHE_MAXSIZE = 512
+
+_detail_page_cache: dict = {}     # url → (expires_at, body, etag, last_modified)
+_detail_page_cache_lock = threading.Lock()
+
+
+def _fetch_detail_page_body(url, timeout):
+    """
+    Return the detail page body for url, from the TTL cache when fresh.
+
+    Expired entries are revalidated with If-None-Match / If-Modified-Since
+    when IRRES.be sent validators; a 304 keeps the cached body.
+    """
+    now = time.monotonic()
+    with _detail_page_cache_lock:
+        hit = _detail_page_cache.get(url)
+    if hit and hit[0] > now:
+        return hit[1]
+
+    headers = HEADERS
+    if hit and (hit[2] or hit[3]):
+        headers = dict(HEADERS)
+        if hit[2]:
+            headers["If-None-Match"] = hit[2]
+        if hit[3]:
+            headers["If-Modified-Since"] = hit[3]
+
+    response = secure_get(url, headers=headers, timeout=timeout)
+    etag          = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if response.status_code == 304 and hit:
+        # Same content: a 304 may omit the validators, so keep the old ones.
+        body          = hit[1]
+        etag          = etag or hit[2]
+        last_modified = last_modified or hit[3]
+    else:
+        # New content only ever carries its own validators.
+        body = response.content
+    entry = (now + DETAIL_PAGE_CACHE_TTL, body, etag, last_modified)
+
+    with _detail_page_cache_lock:
+        _detail_page_cache.pop(url, None)   # re-insert as the newest entry
+        if len(_detail_page_cache) >= DETAIL_PAGE_CACHE_MAXSIZE:
+            # Drop expired entries first, then the oldest ones if still full.
+            for key in [k for k, e in _detail_page_cache.items() if e[0] <= now]:
+                del _detail_page_cache[key]
+            while len(_detail_page_cache) >= DETAIL_PAGE_CACHE_MAXSIZE:
+                del _detail_page_cache[next(iter(_detail_page_cache))]
+        _detail_page_cache[url] = entry
+    return body
+
+
 def fetch_detail_page(url, timeout=12):
     """
     Fetch and parse a listing detail page.
 
-    Uses secure_get() to enforce HTTPS and TLS validation.
+    Uses secure_get() to enforce HTTPS and TLS validation. Page bodies are
+    cached for DETAIL_PAGE_CACHE_TTL seconds; parsing is always fresh.
 
     Args:
         url    : Absolute URL of the detail page.
@@ -1589,200 +1834,414 @@ def fetch_detail_page(url, timeout=12):
         BeautifulSoup object of the parsed page, or None if the request fails.
     """
     try:
-        response = secure_get(url, headers=HEADERS, timeout=timeout)
-        return BeautifulSoup(response.content, 'html.parser')
+        return BeautifulSoup(_fetch_detail_page_body(url, timeout), 'lxml')
     except Exception:
         return None
 
 
+# =============================================================================
+# BLOCK 18b — LISTING HELPER: build_listing_from_card()
+# =============================================================================
+
+def build_listing_from_card(parsed):
+    """
+    Fetch the detail page for one parsed listing card and build its output row.
+
+    Runs on a worker thread of get_listings(); everything it touches (the
+    card dict, its own detail soup) is private to the call.
+
+    Args:
+        parsed: dict returned by parse_main_listing_card(), with a non-empty
+                anchor_name and listing_url.
+
+    Returns:
+        The listing dict, or None when it has no location, price or description.
+    """
+    listing_url = parsed['listing_url']
+    anchor_name = parsed['anchor_name']
+
+    parsed_location = parsed.get('location') or ""
+    lt_mapped         = parsed.get('listing_type') or ""
+
+    photo_url = parsed.get('photo_candidate') or ""
+
+    detail_soup = fetch_detail_page(listing_url)
+
+    price_formatted = ""
+    button2_label   = ""
+    button2_value   = ""
+    address         = ""
+    page_content    = ""
+    email           = ""
+
+    if detail_soup:
+        detail_price_raw = extract_price_from_detail_soup(detail_soup)
+        if detail_price_raw:
+            price_formatted = format_price_string(detail_price_raw)
+        if not price_formatted and parsed.get('price_raw'):
+            price_formatted = format_price_string(parsed['price_raw'])
+
+        _, email = extract_contact_and_email_from_detail(detail_soup)
+        if email:
+            button2_value = f"mailto:{email}"
+            nm = display_name_from_email(email) or email.split("@")[0].capitalize()
+            button2_label = f"Email {nm} - Irres"
+
+        address      = extract_address_from_detail_soup(detail_soup)
+        page_content = extract_page_content_from_detail_soup(detail_soup)
+
+        if not photo_url:
+            fallback = find_landscape_image_from_detail(detail_soup)
+            if fallback:
+                photo_url = fallback
+    elif parsed.get('price_raw'):
+        price_formatted = format_price_string(parsed['price_raw'])
+
+    # Both photo sources (card candidate, detail fallback) are already
+    # absolute URLs from normalize_url().
+
+    title = ""
+    if parsed_location and price_formatted:
+        title = f"{parsed_location}⎥{price_formatted}"
+    elif parsed_location or price_formatted:
+        title = parsed_location or price_formatted
+
+    if (not parsed_location) and title and '⎥' in title:
+        possible_loc = title.split('⎥', 1)[0].strip()
+        if possible_loc and '€' not in possible_loc:
+            parsed_location = normalize_text(possible_loc)
+
+    listing_id      = anchor_name
+    button1_label   = "Bekijk het op onze website"
+    button1_value   = listing_button1_value(listing_url)
+
+    prijs_aanvraag = is_prijs_op_aanvraag_price(price_formatted)
+    button3_label  = "Vraag prijs aan" if prijs_aanvraag else ""
+    button3_value  = ""
+    if prijs_aanvraag and email:
+        subj = f"Prijs aanvraag {listing_id}"
+        button3_value = f"mailto:{email}?subject={quote(subj)}"
+
+    listing_obj = {
+        "listing_id":     listing_id,
+        "listing_url":    listing_url,
+        "listing_type":   lt_mapped,
+        "photo_url":      photo_url,
+        "title":          title,
+        "price":          price_formatted,
+        "location":       parsed_location,
+        "description":    parsed.get('description') or "",
+        "button1_label":  button1_label,
+        "button1_value":  button1_value,
+        "button2_label":  button2_label,
+        "button2_value":  button2_value,
+        "button3_label":  button3_label,
+        "button3_value":  button3_value,
+        "address":        address,
+        "page_content":   page_content,
+    }
+
+    if listing_obj.get("location") or listing_obj.get("price") or listing_obj.get("description"):
+        return listing_obj
+    return None
+
+
+def build_listing_from_link(link):
+    """
+    Parse one listing card <a> and build its output row.
+
+    Returns:
+        The listing dict, or None when the card has no listing URL or the row
+        has no location, price or description.
+    """
+    parsed = parse_main_listing_card(link)
+    if not parsed.get('listing_url'):
+        return None
+    return build_listing_from_card(parsed)
+
+
+def build_listing_from_links(links):
+    """
+    Build the output row for one listing from its card <a> elements (worker entry point).
+
+    Cards sharing a listing id are tried in page order; the first one that
+    yields a row wins, so a duplicate card still counts when the first has
+    no usable data.
+    """
+    for link in links:
+        listing_obj = build_listing_from_link(link)
+        if listing_obj:
+            return listing_obj
+    return None
+
+
 # =============================================================================
 # BLOCK 19 — API ENDPOINT: /api/listings
 # =============================================================================
 
-@limiter.limit("15 per hour")
-@app.route("/listings", methods=["GET"])
-@app.route("/api/listings", methods=["GET"])
-def get_listings():
+_LISTING_ANCHOR_STRAINER = SoupStrainer('a', href=_RE_PAND_HREF)
+
+
+# The finished /api/listings payload is reused for LISTINGS_CACHE_TTL seconds;
+# IRRES.be listings change on a scale of hours, not seconds.
+LISTINGS_CACHE_TTL = 300   # seconds
+
+# Single-flight: at most one scrape runs per process. A request that misses
+# the cache waits up to LISTINGS_SCRAPE_WAIT seconds for a scrape already in
+# progress, then falls back to the expired payload (or a 503) rather than
+# holding a worker thread for the length of a scrape. A failed scrape is
+# remembered for LISTINGS_FAILURE_TTL seconds so queued requests do not each
+# repeat it.
+LISTINGS_SCRAPE_WAIT = 10   # seconds
+LISTINGS_FAILURE_TTL = 60   # seconds
+
+# "payload" outlives "expires_at" on purpose: an expired payload is still
+# served while another request refreshes it. "bodies" holds (serialized
+# bytes, ETag) per ?pretty flag, filled on the first cache hit, so later hits
+# skip serialization entirely and clients can revalidate with If-None-Match.
+_listings_cache: dict = {"expires_at": 0.0, "payload": None, "bodies": {}, "failed_until": 0.0, "error": ""}
+_listings_cache_lock  = threading.Lock()
+_listings_scrape_lock = threading.Lock()
+
+
+def _iter_listings_json(payload):
     """
-    Scrape all active property listings from IRRES.be/te-koop.
+    Yield a compact /api/listings payload as JSON chunks, one per listing.
 
-    This is the most expensive endpoint:
-      - Initial overview page fetch      : ~15 seconds
-      - Per-listing detail page fetches  : many sequential requests
-      - Total wall-clock time            : several minutes per request
+    Byte-for-byte the same as orjson.dumps(payload); "listings" must be the
+    payload's last key.
+    """
+    head = {k: v for k, v in payload.items() if k != "listings"}
+    yield orjson.dumps(head)[:-1] + (b',"listings":[' if head else b'"listings":[')
+    for i, listing in enumerate(payload["listings"]):
+        if i:
+            yield b","
+        yield orjson.dumps(listing)
+    yield b"]}"
 
-    Rate limit: 15 requests per hour per IP (protects both this server and IRRES.be).
 
-    Each listing uses snake_case keys including title, button*_label/value,
-    address, and page_content (full <main> text with markdown links).
+def _listings_json_body(payload):
     """
-    try:
-        t0 = time.perf_counter()
-        list_page_url = "https://irres.be/te-koop"
-        resp          = secure_get(list_page_url, headers=HEADERS, timeout=15)
-        soup          = BeautifulSoup(resp.content, 'html.parser')
+    Serialize a /api/listings payload to UTF-8 JSON with orjson.
 
-        anchors = soup.find_all('a', href=re.compile(r'/pand/\d+/', re.I))
+    Output is compact and streamed listing by listing, so the full document
+    is never held as one buffer; pass ?pretty=1 for 2-space indentation
+    (serialized in one go).
+    """
+    if request.args.get("pretty") == "1":
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return _iter_listings_json(payload)
+
+
+def _cached_listings_response(payload, bodies, stale=False):
+    """Serve a payload held in _listings_cache (expired when stale=True)."""
+    pretty = request.args.get("pretty") == "1"
+    cached = bodies.get(pretty)
+    if cached is None:
+        body = orjson.dumps(payload, option=orjson.OPT_INDENT_2 if pretty else 0)
+        cached = (body, hashlib.blake2b(body, digest_size=16).hexdigest())
+        with _listings_cache_lock:
+            bodies[pretty] = cached
+    body, etag = cached
+    logger.info("event=listings_cache_hit count=%s stale=%s", payload["count"], stale)
+    g._log_summary = "listings_count=%s cached=%s" % (payload["count"], "stale" if stale else "true")
+    response = Response(body, mimetype='application/json; charset=utf-8')
+    response.set_etag(etag)
+    # Answers 304 Not Modified (empty body) when If-None-Match matches.
+    return response.make_conditional(request)
+
+
+def _listings_error_response(error, status):
+    """Build the JSON error response for /api/listings."""
+    payload = {
+        "success":  False,
+        "error":    error,
+        "listings": [],
+    }
+    # Small body: compact bytes in one go (sets Content-Length), no streaming.
+    return Response(
+        orjson.dumps(payload),
+        mimetype='application/json; charset=utf-8'
+    ), status
 
-        seen          = set()
-        listing_links = []
 
-        for a in anchors:
-            href = a.get('href') or ""
-            if not href:
-                continue
+def _scrape_listings_payload():
+    """
+    Scrape /te-koop and every listing detail page into an /api/listings payload.
 
-            full = canonical_listing_url(href)
-            if not full or full in seen:
-                continue
+    The payload is stored in the listings cache before it is returned.
+    Exceptions propagate to the caller.
+    """
+    t0 = time.perf_counter()
+    list_page_url = "https://irres.be/te-koop"
+    resp          = secure_get(list_page_url, headers=HEADERS, timeout=15)
+    # Only /pand/<id>/ anchors (and their card subtrees) are materialized.
+    soup          = BeautifulSoup(resp.content, 'lxml', parse_only=_LISTING_ANCHOR_STRAINER)
+
+    # Recursive on purpose: a /pand/ anchor nested inside another one stays
+    # a child of it in the strained soup, not a top-level node.
+    anchors = soup.find_all('a', href=_RE_PAND_HREF)
+
+    seen          = set()
+    listing_links = []
+
+    for a in anchors:
+        href = a.get('href') or ""
+        if not href:
+            continue
 
-            text = a.get_text(separator="|", strip=True)
-            if not text or not text.strip():
-                continue
+        full = canonical_listing_url(href)
+        if not full or full in seen:
+            continue
 
-            seen.add(full)
-            listing_links.append(a)
+        # Cards without any visible text are skipped; the first non-blank
+        # string is enough to tell, no need to join the whole card text.
+        if next(a.stripped_strings, None) is None:
+            continue
 
-        logger.info("event=listings_scrape_start links=%s", len(listing_links))
+        seen.add(full)
+        listing_links.append(a)
 
-        listings = []
+    logger.info("event=listings_scrape_start links=%s", len(listing_links))
 
-        for link in listing_links:
-            parsed = parse_main_listing_card(link)
+    cards = {}   # listing_id -> its <a> elements, both in page order
 
-            anchor_name = parsed.get('anchor_name') or ""
-            if not anchor_name:
-                logger.debug(
-                    "event=listing_skip_card reason=missing_listing_id anchor_name_empty"
-                )
-                continue
+    for link in listing_links:
+        anchor_name = listing_anchor_name(link)
+        if not anchor_name:
+            logger.debug(
+                "event=listing_skip_card reason=missing_listing_id anchor_name_empty"
+            )
+            continue
 
-            listing_url = parsed.get('listing_url') or ""
-            if not listing_url:
-                continue
+        # Group by listing_id from the attributes alone, before any card is
+        # parsed or any detail page is fetched. Later cards are only parsed
+        # when the earlier ones for the same id build no row.
+        cards.setdefault(anchor_name, []).append(link)
+
+    # Cards are parsed and their detail pages fetched concurrently, so the
+    # first detail requests go out while later cards are still parsed;
+    # results come back in card order. Each task runs in a copy of the
+    # caller's context so its log lines keep the request_id.
+    with ThreadPoolExecutor(max_workers=DETAIL_FETCH_WORKERS) as pool:
+        futures = [
+            pool.submit(contextvars.copy_context().run, build_listing_from_links, links)
+            for links in cards.values()
+        ]
+        listings = [obj for obj in (f.result() for f in futures) if obj]
+
+    elapsed_ms = int((time.perf_counter() - t0) * 1000)
+    logger.info(
+        "event=listings_scrape_done count=%s duration_ms=%s",
+        len(listings),
+        elapsed_ms,
+    )
 
-            parsed_location = parsed.get('location') or ""
-            lt_mapped         = parsed.get('listing_type') or ""
-
-            photo_url = parsed.get('photo_candidate') or ""
-
-            time.sleep(0.09)
-            detail_soup = fetch_detail_page(listing_url)
-
-            price_formatted = ""
-            button2_label   = ""
-            button2_value   = ""
-            address         = ""
-            page_content    = ""
-            email           = ""
-
-            if detail_soup:
-                detail_price_raw = extract_price_from_detail_soup(detail_soup)
-                if detail_price_raw:
-                    price_formatted = format_price_string(detail_price_raw)
-                if not price_formatted and parsed.get('price_raw'):
-                    price_formatted = format_price_string(parsed['price_raw'])
-
-                _, email = extract_contact_and_email_from_detail(detail_soup)
-                if email:
-                    button2_value = f"mailto:{email}"
-                    nm = display_name_from_email(email) or email.split("@")[0].capitalize()
-                    button2_label = f"Email {nm} - Irres"
-
-                address      = extract_address_from_detail_soup(detail_soup)
-                page_content = extract_page_content_from_detail_soup(detail_soup)
-
-                if not photo_url:
-                    fallback = find_landscape_image_from_detail(detail_soup)
-                    if fallback:
-                        photo_url = fallback
-            elif parsed.get('price_raw'):
-                price_formatted = format_price_string(parsed['price_raw'])
-
-            photo_url = normalize_url(photo_url) if photo_url else ""
-
-            title = ""
-            if parsed_location and price_formatted:
-                title = f"{parsed_location}⎥{price_formatted}"
-            elif parsed_location or price_formatted:
-                title = parsed_location or price_formatted
-
-            if (not parsed_location) and title and '⎥' in title:
-                possible_loc = title.split('⎥', 1)[0].strip()
-                if possible_loc and '€' not in possible_loc:
-                    parsed_location = normalize_text(possible_loc)
-
-            listing_id      = anchor_name
-            button1_label   = "Bekijk het op onze website"
-            button1_value   = listing_button1_value(listing_url)
-
-            prijs_aanvraag = is_prijs_op_aanvraag_price(price_formatted)
-            button3_label  = "Vraag prijs aan" if prijs_aanvraag else ""
-            button3_value  = ""
-            if prijs_aanvraag and email:
-                subj = f"Prijs aanvraag {listing_id}"
-                button3_value = f"mailto:{email}?subject={quote(subj)}"
-
-            listing_obj = {
-                "listing_id":     listing_id,
-                "listing_url":    listing_url,
-                "listing_type":   lt_mapped,
-                "photo_url":      photo_url,
-                "title":          title,
-                "price":          price_formatted,
-                "location":       parsed_location,
-                "description":    parsed.get('description') or "",
-                "button1_label":  button1_label,
-                "button1_value":  button1_value,
-                "button2_label":  button2_label,
-                "button2_value":  button2_value,
-                "button3_label":  button3_label,
-                "button3_value":  button3_value,
-                "address":        address,
-                "page_content":   page_content,
-            }
+    payload = {
+        "success":  True,
+        "count":    len(listings),
+        "listings": listings,
+    }
+    with _listings_cache_lock:
+        _listings_cache["payload"]    = payload
+        _listings_cache["bodies"]     = {}
+        _listings_cache["expires_at"] = time.monotonic() + LISTINGS_CACHE_TTL
+    return payload
 
-            if listing_obj.get("location") or listing_obj.get("price") or listing_obj.get("description"):
-                listings.append(listing_obj)
 
-        uniq     = []
-        seen_ids = set()
-        for li in listings:
-            lid = li.get("listing_id")
-            if lid in seen_ids:
-                continue
-            seen_ids.add(lid)
-            uniq.append(li)
+def warm_listings_cache():
+    """
+    Fill the listings cache once at import (opt-in via PRELOAD_WARMUP=1).
 
-        elapsed_ms = int((time.perf_counter() - t0) * 1000)
-        logger.info(
-            "event=listings_scrape_done count=%s duration_ms=%s",
-            len(uniq),
-            elapsed_ms,
-        )
-        g._log_summary = "listings_count=%s" % len(uniq)
+    With gunicorn's preload_app the scrape runs in the master, so every
+    forked worker starts with a warm cache. Failures are logged and ignored;
+    the first request then scrapes as usual.
+    """
+    try:
+        with _listings_scrape_lock:
+            payload = _scrape_listings_payload()
+        logger.info("event=listings_cache_warmed count=%s", payload["count"])
+    except Exception as e:
+        logger.warning("event=listings_cache_warm_failed error=%s", e)
+    finally:
+        # Drop pooled sockets so forked workers never share a connection.
+        HTTP_SESSION.close()
 
-        payload = {
-            "success":  True,
-            "count":    len(uniq),
-            "listings": uniq,
-        }
+
+@limiter.limit("15 per hour")
+@app.route("/listings", methods=["GET"])
+@app.route("/api/listings", methods=["GET"])
+def get_listings():
+    """
+    Scrape all active property listings from IRRES.be/te-koop.
+
+    This is the most expensive endpoint:
+      - Initial overview page fetch      : ~15 seconds
+      - Per-listing detail page fetches  : one per listing, DETAIL_FETCH_WORKERS at a time
+      - Total wall-clock time            : up to a few minutes per request
+
+    Rate limit: 15 requests per hour per IP (protects both this server and IRRES.be).
+
+    Each listing uses snake_case keys including title, button*_label/value,
+    address, and page_content (full <main> text with markdown links).
+
+    Successful payloads are served from memory for LISTINGS_CACHE_TTL seconds;
+    cached responses carry an ETag and honour If-None-Match (304). Only one
+    scrape runs at a time: a concurrent miss waits at most LISTINGS_SCRAPE_WAIT
+    seconds for it, then gets the expired payload or a 503. A failed scrape is
+    answered from memory for LISTINGS_FAILURE_TTL seconds instead of being
+    retried by every waiting request.
+    """
+    with _listings_cache_lock:
+        payload = _listings_cache["payload"]
+        bodies  = _listings_cache["bodies"]
+        fresh   = payload is not None and _listings_cache["expires_at"] > time.monotonic()
+    if fresh:
+        return _cached_listings_response(payload, bodies)
+
+    if not _listings_scrape_lock.acquire(timeout=LISTINGS_SCRAPE_WAIT):
+        logger.info("event=listings_scrape_wait_timeout stale_available=%s", payload is not None)
+        if payload is not None:
+            return _cached_listings_response(payload, bodies, stale=True)
+        return _listings_error_response("Listings are being refreshed, retry shortly", 503)
+
+    try:
+        # Re-check under the scrape lock: the scrape this request waited on
+        # may have refilled the cache, or just failed.
+        with _listings_cache_lock:
+            payload = _listings_cache["payload"]
+            bodies  = _listings_cache["bodies"]
+            fresh   = payload is not None and _listings_cache["expires_at"] > time.monotonic()
+            failed  = _listings_cache["failed_until"] > time.monotonic()
+            error   = _listings_cache["error"]
+        if fresh:
+            return _cached_listings_response(payload, bodies)
+        if failed:
+            return _listings_error_response(error, 500)
+
+        payload = _scrape_listings_payload()
+        g._log_summary = "listings_count=%s" % payload["count"]
         return Response(
-            json.dumps(payload, ensure_ascii=False, indent=2),
+            _listings_json_body(payload),
             mimetype='application/json; charset=utf-8'
         )
 
     except Exception as e:
         logger.exception("event=listings_scrape_failed http_status=500 success_json=false")
-        payload = {
-            "success":  False,
-            "error":    str(e),
-            "listings": [],
-        }
-        return Response(
-            json.dumps(payload, ensure_ascii=False, indent=2),
-            mimetype='application/json; charset=utf-8'
-        ), 500
+        with _listings_cache_lock:
+            _listings_cache["failed_until"] = time.monotonic() + LISTINGS_FAILURE_TTL
+            _listings_cache["error"]        = str(e)
+        return _listings_error_response(str(e), 500)
+
+    finally:
+        _listings_scrape_lock.release()
+
+
+# Opt-in: scrape once at import so the first /api/listings call is a cache hit.
+# Under gunicorn's preload_app this runs before the port is bound, so the
+# service is unreachable for the length of the scrape (see gunicorn_config.py).
+if os.getenv("PRELOAD_WARMUP") == "1":
+    warm_listings_cache()
 
 
 # =============================================================================
@@ -1972,7 +2431,8 @@ def root():
             "/listings": "Same as /api/listings — full listing scrape (slow).",
             "/api/listings": (
                 "Scrape all active property listings with contact info and "
-                "full page content. Expensive — allow several minutes."
+                "full page content. Expensive — allow several minutes. "
+                "Compact JSON; add ?pretty=1 for indented output."
             ),
             "/locations": "Same as /api/locations — filter locations JSON or CSV.",
             "/api/locations": (
@@ -1994,5 +2454,7 @@ def root():
 # BLOCK 23 — RUN SERVER
 # =============================================================================
 
+# Werkzeug dev server for local runs only. Production runs under gunicorn
+# with gthread workers: gunicorn -c gunicorn_config.py wsgi:app
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000)
@@ -9,7 +9,11 @@ bind = "0.0.0.0:5000"
 workers = 2
 
 # Worker class
-worker_class = "sync"
+# gthread: each worker serves several requests concurrently on threads, so a
+# long /api/listings scrape (blocked on network I/O) no longer ties up the
+# whole worker while /health or /api/locations calls queue behind it.
+worker_class = "gthread"
+threads = 4
 
 # Timeout settings - IMPORTANT for slow scraping requests
 timeout = 300  # 5 minutes - allows time for all listings to be fetched
@@ -22,4 +26,10 @@ errorlog = "-"
 loglevel = "info"
 
 # Preload app for better performance
+# With PRELOAD_WARMUP=1 the app scrapes /api/listings once while preloading,
+# so every forked worker starts with a warm listings cache. The preload runs
+# before gunicorn binds its port: nothing (not even /health) answers until
+# the scrape is done, which can take minutes, so raise the platform's startup
+# / health-check grace period accordingly. The cache TTL starts counting at
+# the end of the warm-up, not when the workers come up.
 preload_app = True
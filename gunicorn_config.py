@@ -1,3 +1,5 @@
+# Run with: gunicorn -c gunicorn_config.py wsgi:app
+
 import os
 
 # Bind to 0.0.0.0 on Render's assigned port (falls back to 5000 locally)
@@ -7,7 +9,11 @@ bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
 workers = 2
 
 # Worker class
-worker_class = "sync"
+# gthread: each worker serves several requests concurrently on threads, so a
+# long /api/listings scrape (blocked on network I/O) no longer ties up the
+# whole worker while /health or /api/locations calls queue behind it.
+worker_class = "gthread"
+threads = 4
 
 # Timeout settings - IMPORTANT for slow scraping requests
 # Allow up to 15 minutes so the full scrape can complete, even when there are many listings
@@ -21,4 +27,10 @@ errorlog = "-"
 loglevel = "info"
 
 # Preload app for better performance
+# With PRELOAD_WARMUP=1 the app scrapes /api/listings once while preloading,
+# so every forked worker starts with a warm listings cache. The preload runs
+# before gunicorn binds its port: nothing (not even /health) answers until
+# the scrape is done, which can take minutes, so raise the platform's startup
+# / health-check grace period accordingly. The cache TTL starts counting at
+# the end of the warm-up, not when the workers come up.
 preload_app = True